@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Compares the throughput of the validated models and the raw mode, which decodes
+the responses into plain dicts, for the largest plays of a corpus. The plays are
+downloaded once beforehand, so that the decoding and validation are measured
+rather than the network.
+
+Runs against the local test server of test/compose.dracor_api.dev.yml by default:
+
+    python benchmark/benchmark_raw.py --corpus test --plays 10 --repeat 5
+"""
+import argparse
+import time
+
+from pydracor_base.rest import RESTResponse
+
+from pydracor import DraCorAPI, Play
+from pydracor.raw import loads, orjson
+
+
+class RecordedResponse:
+    """
+    Minimal stand-in for a urllib3 response replaying a recorded body.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.status = 200
+        self.reason = "OK"
+        self.data = data
+        self.headers = {"content-type": "application/json; charset=utf-8"}
+
+
+def largest_plays(host: str, corpus_name: str, num_plays: int):
+    """
+    Returns the names of the num_plays plays with the most words.
+    """
+    metadata = DraCorAPI(host=host, raw=True).get_corpus(corpus_name).get_metadata()
+    metadata.sort(key=lambda play: play.get("wordCountText") or 0, reverse=True)
+    return [play["name"] for play in metadata[:num_plays]]
+
+
+def run(parse, bodies, repeat: int) -> float:
+    """
+    Parses all bodies repeat times and returns the number of plays per second.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            parse(body)
+    return repeat * len(bodies) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="http://localhost:8088/api/v1")
+    parser.add_argument("--corpus", default="test")
+    parser.add_argument("--plays", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    api = DraCorAPI(host=args.host)._api
+    bodies = []
+    for play_name in largest_plays(args.host, args.corpus, args.plays):
+        response = api.play_info_without_preload_content(args.corpus, play_name)
+        bodies.append(RESTResponse(response).read())
+    megabytes = sum(len(body) for body in bodies) / 2 ** 20
+    print(f"{len(bodies)} plays, {megabytes:.1f} MB of JSON, decoder: {'orjson' if orjson else 'json'}")
+
+    def validated(body: bytes) -> Play:
+        # the same deserialization as DraCorAPI.get_play
+        response = RESTResponse(RecordedResponse(body))
+        response.read()
+        play_model = api.api_client.response_deserialize(response, {"200": "Play"}).data
+        return Play(api, play_model)
+
+    modes = {
+        "validated": validated,
+        "raw": lambda body: Play._from_json(api, loads(body)),
+        "raw (dicts only)": loads,
+    }
+    for name, parse in modes.items():
+        throughput = run(parse, bodies, args.repeat)
+        print(f"{name:20} {throughput:10.1f} plays/s")
+
+
+if __name__ == "__main__":
+    main()
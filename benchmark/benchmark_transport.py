@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Compares the throughput of the default urllib3 transport and HTTPXTransport
+for many concurrent small requests (info, metrics, characters).
+
+Runs against the local test server of test/compose.dracor_api.dev.yml by default:
+
+    python benchmark/benchmark_transport.py --requests 2000 --threads 32 --allow-http1
+
+The httpx backend requests HTTP/2. It is negotiated for https hosts; plain http
+hosts only use HTTP/2 with --prior-knowledge, which requires a server accepting
+HTTP/2 without TLS (h2c). The negotiated HTTP version of each backend is printed,
+and the benchmark stops if HTTP/2 is not used by the httpx backend, e.g. against
+the local test server without --prior-knowledge; --allow-http1 compares httpx
+over HTTP/1.1 instead.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pydracor import DraCorAPI
+from pydracor.transport import HTTPXTransport
+
+
+def run(dracor: DraCorAPI, corpus_name: str, num_requests: int, threads: int) -> float:
+    """
+    Sends num_requests requests from threads threads and returns the number of requests per second.
+    """
+    plays = [dracor.get_play(corpus_name, play.name) for play in dracor.get_corpus(corpus_name).plays]
+    calls = [dracor.get_info]
+    for play in plays:
+        calls.extend([play.get_metrics, play.get_characters])
+    # warm up the connections
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda i: calls[i % len(calls)](), range(threads)))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda i: calls[i % len(calls)](), range(num_requests)))
+    return num_requests / (time.perf_counter() - start)
+
+
+def http_version(dracor: DraCorAPI) -> str:
+    """
+    Returns the HTTP version negotiated by the transport of dracor.
+    """
+    response = dracor._api.api_info_without_preload_content()
+    if hasattr(response, "http_version"):
+        # httpx response
+        return response.http_version
+    # urllib3 response, e.g. version 11 for HTTP/1.1
+    return f"HTTP/{response.version // 10}.{response.version % 10}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="http://localhost:8088/api/v1")
+    parser.add_argument("--corpus", default="test")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--prior-knowledge", action="store_true", help="use HTTP/2 without TLS negotiation")
+    parser.add_argument("--allow-http1", action="store_true", help="run the httpx backend even if HTTP/2 is not used")
+    args = parser.parse_args()
+
+    # coalescing is switched off, so that every call sends a request
+    backends = {
+        "urllib3 (default)": lambda: DraCorAPI(host=args.host, coalesce=False),
+        "httpx": lambda: DraCorAPI(
+            host=args.host, coalesce=False, transport=HTTPXTransport(http1=not args.prior_knowledge)
+        ),
+    }
+    for name, create in backends.items():
+        dracor = create()
+        version = http_version(dracor)
+        if name == "httpx" and version != "HTTP/2" and not args.allow_http1:
+            sys.exit(
+                f"httpx negotiated {version} instead of HTTP/2 with {args.host}, use an https host "
+                "or --prior-knowledge with an h2c server, or pass --allow-http1"
+            )
+        throughput = run(dracor, args.corpus, args.requests, args.threads)
+        print(f"{name:20} {version:10} {throughput:10.1f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,5 @@
 from .api_wrapper import DraCorAPI, Corpus, Play, Wikidata, DTS, DownloadFormat, CorpusNotFound, PlayNotFound, InvalidParameterCombination, IncludeType, DownloadFormat
+from .archive import TEIArchive
+from .network import NetworkMetrics
+from .transport import HTTPXTransport, HostPool
+from .records import NetworkEdge, Relation
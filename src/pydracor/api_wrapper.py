@@ -1,8 +1,15 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import copy
+import functools
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pydracor_base.api_client import ApiClient
 from pydracor_base.api.public_api import PublicApi
@@ -14,6 +21,7 @@ from pydracor_base.models import Play as PlayModel
 from pydracor_base.models import PlayMetadata
 from pydracor_base.models.character import Character
 from pydracor_base.models.corpus_in_corpora import CorpusInCorpora
+from pydracor_base.models.play_in_corpus import PlayInCorpus
 from pydracor_base.models.play_metrics import PlayMetrics
 from pydracor_base.models.play_with_wikidata_character import PlayWithWikidataCharacter
 from pydracor_base.models.spoken_text_by_character import SpokenTextByCharacter
@@ -21,6 +29,10 @@ from pydracor_base.models.dts_entrypoint import DtsEntrypoint
 from pydracor_base.exceptions import NotFoundException, BadRequestException
 from pydracor_base.configuration import Configuration
 
+from .raw import read_json
+from .records import NetworkEdge, Relation, _column_types, _is_streaming, _stream_requests, iter_csv_records
+from .transport import HostPool
+
 class CorpusNotFound(Exception):
     """
     Exception raised when a specified corpus is not found in the DraCor API.
@@ -66,6 +78,220 @@ class DownloadFormat(str, Enum):
     gexf = "gexf"
     graphml = "graphml"
 
+
+class _Call:
+    """
+    A call in flight in _SingleFlight, holding its result or exception once done.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        # number of callers waiting for the result besides the executing one
+        self.waiters = 0
+
+
+class _SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call. The first 
+    caller executes the call, all callers arriving while it is in flight wait for 
+    it and share its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, _Call] = {}
+
+    def do(self, key: Any, func: Callable[[], Any]) -> Any:
+        """
+        Executes func, unless a call with the same key is already in flight.
+        Args:
+            key (Any): Hashable key identifying the call.
+            func (Callable): Function executing the call.
+        Returns:
+            Any: The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _copy_error(call.error) from call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """
+    Returns a copy of the exception of a shared call without traceback, so that each
+    waiting caller raises it with its own traceback instead of extending the shared one.
+    """
+    try:
+        return copy.copy(error).with_traceback(None)
+    except Exception:
+        # exceptions which cannot be copied are raised as they are
+        return error
+
+
+class _CoalescingRESTClient:
+    """
+    Wraps the REST client of an ApiClient so that concurrent identical GET 
+    requests (same URL and headers) share one HTTP request. The shared response 
+    is read completely before it is handed to the callers, which deserialize it 
+    independently. Streamed requests are not coalesced.
+    """
+
+    def __init__(self, rest_client) -> None:
+        self._rest_client = rest_client
+        self._flight = _SingleFlight()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._rest_client, name)
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        """
+        Performs the request, coalescing it with identical GET requests in flight.
+        """
+        if method.upper() != "GET" or body is not None or post_params or _is_streaming():
+            return self._rest_client.request(
+                method, url, headers=headers, body=body, post_params=post_params, _request_timeout=_request_timeout
+            )
+
+        def fetch():
+            response = self._rest_client.request(method, url, headers=headers, _request_timeout=_request_timeout)
+            response.read()
+            return response
+
+        key = (url, tuple(sorted((headers or {}).items())))
+        return self._flight.do(key, fetch)
+
+
+def _build_api_client(api_client=None, host=None, coalesce=True, transport=None) -> ApiClient:
+    """
+    Returns the API client used by a wrapper class. The given or default API client 
+    is not changed; a new API client sharing its configuration, headers and 
+    connections is created for the wrapper.
+    Args:
+        api_client: An optional API client instance, defaults to the default ApiClient.
+        host (Union[str, Sequence[str]]): An optional host URL, if set a new API client is 
+            created for it. For several host URLs, the requests are distributed by a HostPool. 
+            With a HostPool, also if passed as transport, the API client is created for its 
+            first host.
+        coalesce (bool): Whether concurrent identical GET requests share one HTTP request.
+        transport: An optional transport sending the HTTP requests instead of the urllib3 
+            client of pydracor-base, e.g. HTTPXTransport or HostPool. It must provide the 
+            method request of RESTClientObject.
+    Returns:
+        ApiClient: The API client.
+    """
+    if host and not isinstance(host, str):
+        transport = HostPool(host, transport)
+    if isinstance(transport, HostPool):
+        # the pool routes the URLs of its first host, like a single host it overrides api_client
+        host = transport.hosts[0]
+    if host:
+        api_client = ApiClient(configuration=Configuration(host=host))
+    else:
+        api_client = _copy_api_client(api_client or ApiClient.get_default())
+    rest_client = transport if transport is not None else api_client.rest_client
+    if isinstance(rest_client, _CoalescingRESTClient):
+        rest_client = rest_client._rest_client
+    api_client.rest_client = _CoalescingRESTClient(rest_client) if coalesce else rest_client
+    return api_client
+
+
+def _copy_api_client(api_client: ApiClient) -> ApiClient:
+    """
+    Returns a new API client with the configuration, headers and REST client of the given one.
+    """
+    copy = ApiClient(configuration=api_client.configuration, cookie=api_client.cookie)
+    copy.default_headers = dict(api_client.default_headers)
+    copy.rest_client = api_client.rest_client
+    return copy
+
+
+_api_handles: Dict[Union[str, Tuple[str, ...]], PublicApi] = {}
+
+
+def _api_for_host(host: Union[str, Tuple[str, ...]]) -> PublicApi:
+    """
+    Returns the PublicApi handle of the current process for the given host, 
+    creating it on first use. Used to rebuild Corpus and Play instances after 
+    unpickling, e.g. in worker processes.
+    Args:
+        host (Union[str, Tuple[str, ...]]): The host URL of the DraCor API, or the 
+            host URLs of a HostPool.
+    Returns:
+        PublicApi: An API handle configured for the host.
+    """
+    if host not in _api_handles:
+        _api_handles[host] = PublicApi(_build_api_client(host=host))
+    return _api_handles[host]
+
+
+def _host_of(api: PublicApi) -> Union[str, Tuple[str, ...]]:
+    """
+    Returns the host URL of an API handle, or the host URLs if it uses a HostPool.
+    """
+    rest_client = api.api_client.rest_client
+    if isinstance(rest_client, _CoalescingRESTClient):
+        rest_client = rest_client._rest_client
+    if isinstance(rest_client, HostPool):
+        return tuple(rest_client.hosts)
+    return api.api_client.configuration.host
+
+
+class _PicklableApiMixin:
+    """
+    Makes Corpus and Play instances picklable. Instead of the PublicApi instance,
+    only its host is pickled; the API handle is rebuilt on unpickling.
+    """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["__pydantic_private__"] = {**state["__pydantic_private__"], "_api": None}
+        state["_host"] = _host_of(self._api)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        host = state.pop("_host")
+        super().__setstate__(state)
+        self._api = _api_for_host(host)
+
+
+def _get_json(api: PublicApi, endpoint: str, *args) -> Any:
+    """
+    Requests a JSON endpoint of the PublicApi and decodes the response without
+    validating it, for the raw mode.
+    """
+    return read_json(getattr(api, f"{endpoint}_without_preload_content")(*args))
+
+
+def _load_play(api: PublicApi, corpus_name: str, play_name: str, raw: bool = False) -> Play:
+    """
+    Downloads a play and creates a Play instance, without validation in raw mode.
+    """
+    if raw:
+        return Play._from_json(api, _get_json(api, "play_info", corpus_name, play_name))
+    return Play(api, api.play_info(corpus_name, play_name))
+
+
 class DraCorAPI:
     """
     A wrapper class for interacting with the DraCor API.
@@ -74,32 +300,44 @@ class DraCorAPI:
     Attributes:
     """
 
-    def __init__(self, api_client=None, host=None) -> None:
+    def __init__(self, api_client=None, host=None, coalesce=True, transport=None, raw=False) -> None:
         """
         Initializes the DraCorAPI instance with an optional API client or host URL.
         Args:
             api_client: An optional API client instance to use for requests.
-            host (str): An optional host URL to configure the API client, can e.g. be set to localhost or staging.
+            host (Union[str, List[str]]): An optional host URL to configure the API client, can e.g. be set to localhost or staging. 
+                For a list of host URLs, e.g. mirrors, each request is routed to the available host with the 
+                lowest latency and fails over to the other hosts, see HostPool.
+            coalesce (bool): Whether concurrent identical requests, e.g. from several threads 
+                requesting the same play, share one HTTP request and its result. Defaults to True.
+            transport: An optional transport for the HTTP requests, e.g. HTTPXTransport for HTTP/2. 
+                Defaults to the urllib3 client of pydracor-base.
+            raw (bool): Whether JSON responses are decoded into plain dicts and lists (with 
+                orjson, if installed) instead of validated models, for bulk harvesting. 
+                Corpus and Play instances created by this instance inherit the raw mode. 
+                Defaults to False.
         """
-        if host:
-            configuration = Configuration(host=host)
-            api_client = ApiClient(configuration=configuration)
-        self._api = PublicApi(api_client)
+        self._api = PublicApi(_build_api_client(api_client, host, coalesce, transport))
+        self._raw = raw
 
     def get_info(self) -> Info:
         """
         Retrieves general information about the DraCor API.
         Returns:
-            Info: Information about the API.
+            Info: Information about the API, a dict in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "api_info")
         return self._api.api_info()
 
     def get_corpora(self, include: Optional[IncludeType]=None) -> List[CorpusInCorpora]:
         """
         Retrieves a list of available corpora. Optionally includes additional metadata.
         Returns:
-            List[CorpusInCorpora]: Metadata for the corpora in DraCor.
+            List[CorpusInCorpora]: Metadata for the corpora in DraCor, dicts in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "list_corpora", include)
         return self._api.list_corpora(include)
 
     def get_corpus(self, name: str) -> Corpus:
@@ -116,7 +354,7 @@ class DraCorAPI:
             corpus = self._api.list_corpus_content(name)
         except NotFoundException as e:
             raise CorpusNotFound(f"The name {name} is not a valid corpus name") from e
-        return Corpus(self._api, corpus)
+        return Corpus(self._api, corpus, raw=self._raw)
 
     def get_play(self, corpus_name: str, play_name: str) -> Play:
         """
@@ -130,10 +368,44 @@ class DraCorAPI:
             PlayNotFound: If the specified play name is not valid within the given corpus.
         """
         try:
-            play = self._api.play_info(corpus_name, play_name)
+            return _load_play(self._api, corpus_name, play_name, self._raw)
         except NotFoundException as e:
             raise PlayNotFound(f"The play name {play_name} is not a valid play name in corpus {corpus_name}") from e
-        return Play(self._api, play)
+
+    def iter_plays(
+        self,
+        corpus_names: Optional[Iterable[str]] = None,
+        play_filter: Optional[Callable[[PlayInCorpus], bool]] = None,
+        prefetch: int = 4,
+        fetch: Optional[List[str]] = None,
+    ) -> Iterator[Play]:
+        """
+        Iterates over the plays of several corpora in order, optionally filtered.
+        The next plays and the data listed in fetch are downloaded in background 
+        threads, see Corpus.iter_plays.
+        Args:
+            corpus_names (Optional[Iterable[str]]): Names of the corpora, defaults to all corpora.
+            play_filter (Optional[Callable[[PlayInCorpus], bool]]): Selects the plays to 
+                yield by their entry in the corpus, e.g. lambda play: play.year_normalized > 1800.
+            prefetch (int): Number of plays downloaded ahead.
+            fetch (Optional[List[str]]): Play data to download ahead, given by the name 
+                of a Play getter without the prefix "get_", e.g. "tei" or "metrics".
+        Returns:
+            Iterator[Play]: The selected plays in order.
+        Raises:
+            CorpusNotFound: If one of the corpus names is not valid.
+            ValueError: If one of the names in fetch does not refer to a Play getter.
+        """
+        fetch = _check_fetch(fetch)
+        if corpus_names is None:
+            corpus_names = [corpus.name for corpus in self._api.list_corpora()]
+
+        def play_keys() -> Iterator[Tuple[str, str]]:
+            for corpus_name in corpus_names:
+                for play in self.get_corpus(corpus_name).plays:
+                    if play_filter is None or play_filter(play):
+                        yield corpus_name, play.name
+        return _iter_plays(self._api, play_keys(), prefetch, fetch, self._raw)
 
     def get_resolve_play_id(self, dracor_play_id: str) -> None:
         """
@@ -153,37 +425,46 @@ class DraCorAPI:
         Args:
             wikidata_id: Wikidata ID of a character. 
         Returns:
-            List[PlayWithWikidataCharacter]: List of information about the plays including the character.    
+            List[PlayWithWikidataCharacter]: List of information about the plays including the character, 
+                dicts in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "plays_with_character", wikidata_id)
         return self._api.plays_with_character(wikidata_id)
 
 
-class Corpus(CorpusModel):
+class Corpus(_PicklableApiMixin, CorpusModel):
     """
     Represents a DraCor corpus, extending the CorpusModel class and wrapping functionality
     for interacting the corpus' data through the PublicApi.
 
     Attributes:
         _api (PublicApi): An instance of the PublicApi class used to interact with the API.
+        _raw (bool): Whether JSON responses are returned as plain dicts and lists without validation.
     """
     _api: PublicApi
+    _raw: bool = False
 
-    def __init__(self, api: PublicApi, corpus_model: CorpusModel) -> None:
+    def __init__(self, api: PublicApi, corpus_model: CorpusModel, raw: bool = False) -> None:
         """
         Initializes the Corpus instance with the given API and corpus model.
         Args:
             api (PublicApi): The API instance used to fetch corpus data.
             corpus_model (PlayModel): The base corpus model containing initial data.
+            raw (bool): Whether to use the raw mode, see DraCorAPI.
         """
         super().__init__(**corpus_model.model_dump())
         self._api = api
+        self._raw = raw
 
     def get_metadata(self) -> List[PlayMetadata]:
         """
         Retrieves metadata for all plays in the corpus.
         Returns:
-            List[PlayMetadata]: Metadata for the plays in the corpus.
+            List[PlayMetadata]: Metadata for the plays in the corpus, dicts in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "corpus_metadata", self.name)
         return self._api.corpus_metadata(self.name)
 
     def get_metadata_csv(self) -> str:
@@ -194,6 +475,23 @@ class Corpus(CorpusModel):
         """
         return self._api.corpus_metadata_csv_endpoint(self.name)
 
+    def iter_metadata_csv(self) -> Iterator[tuple]:
+        """
+        Streams the metadata for all plays in the corpus in CSV format and parses it 
+            row by row, without holding the whole CSV in memory. The records are 
+            namedtuples with the CSV columns in snake case as fields, e.g. first_author. 
+            The values of each column have the type of the corresponding PlayMetadata 
+            field (int, float or bool), other columns are strings; missing values are None. 
+            The request is sent when the first record is requested.
+        Returns:
+            Iterator[tuple]: Metadata records for the plays in the corpus.
+        """
+        with _stream_requests():
+            response = self._api.corpus_metadata_csv_endpoint_without_preload_content(self.name)
+        yield from iter_csv_records(
+            response, type_name="PlayMetadataRecord", column_types=_column_types(PlayMetadata)
+        )
+
     def get_play(self, play_name: str) -> Optional[Play]:
         """
         Creates a play instance whith the corpus name and the play name. 
@@ -203,18 +501,204 @@ class Corpus(CorpusModel):
         """
         if play_name not in [play.name for play in self.plays]:
             raise PlayNotFound(f"The play name {play_name} is not a valid play name in corpus {self.name}.")
-        play = self._api.play_info(self.name, play_name)
-        return Play(self._api, play)
+        return _load_play(self._api, self.name, play_name, self._raw)
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        processes: Optional[int] = None,
+        fetch: Optional[List[str]] = None,
+        play_names: Optional[Iterable[str]] = None,
+        reduce: Optional[Callable[[Any, Any], Any]] = None,
+        initial: Any = None,
+    ) -> Any:
+        """
+        Applies func to the plays of the corpus in a pool of worker processes. 
+            The plays and the data listed in fetch are downloaded by a pool of 
+            threads while the worker processes compute, so that I/O and computation
+            overlap. func is called as func(play, **fetched), e.g. with fetch=["tei"] 
+            as func(play, tei=...). func must be picklable, i.e. defined at module level. 
+            The worker processes are started with the spawn method, as forking a 
+            process running download threads can deadlock; scripts calling map must 
+            therefore guard their entry point with if __name__ == "__main__". 
+            In the worker processes, each play uses an API handle rebuilt for the 
+            host of the corpus.
+        Args:
+            func (Callable): Function applied to each play.
+            processes (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+            fetch (Optional[List[str]]): Play data to download before calling func, given 
+                by the name of a Play getter without the prefix "get_", e.g. "tei", "txt", 
+                "metrics" or "spoken_text_by_character".
+            play_names (Optional[Iterable[str]]): Names of the plays to process, defaults to all plays of the corpus.
+            reduce (Optional[Callable]): Function combining the accumulated value and a 
+                result, e.g. operator.add. If set, the reduced value is returned.
+            initial (Any): Initial value of the reduction. If None, the first result is used.
+        Returns:
+            Iterator[Tuple[str, Any]]: Tuples of play name and result in the order of 
+                completion, if reduce is not set.
+            Any: The reduced value, if reduce is set.
+        Raises:
+            PlayNotFound: If one of the play names is not valid in the corpus.
+            ValueError: If one of the names in fetch does not refer to a Play getter.
+        """
+        fetch = _check_fetch(fetch)
+        names = self._play_names(play_names)
+        results = self._map(func, processes or os.cpu_count() or 1, fetch, names)
+        if reduce is None:
+            return results
+        accumulated = initial
+        for i, (_, result) in enumerate(results):
+            accumulated = result if i == 0 and initial is None else reduce(accumulated, result)
+        return accumulated
+
+    def _map(
+        self, func: Callable[..., Any], processes: int, fetch: List[str], names: List[str]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Generator behind Corpus.map. At most 2 * processes plays are downloaded or 
+        processed at the same time, which bounds memory use.
+        """
+        window = 2 * processes
+        queue = deque(names)
+        # spawn instead of fork, the download threads are already running when the workers start
+        with ThreadPoolExecutor(max_workers=processes) as io_pool, \
+                ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as cpu_pool:
+            downloads, computations = {}, {}
+            while queue or downloads or computations:
+                while queue and len(downloads) + len(computations) < window:
+                    play_name = queue.popleft()
+                    downloads[io_pool.submit(self._fetch, play_name, fetch)] = play_name
+                done, _ = wait(list(downloads) + list(computations), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in downloads:
+                        play_name = downloads.pop(future)
+                        play, fetched = future.result()
+                        computations[cpu_pool.submit(func, play, **fetched)] = play_name
+                    else:
+                        yield computations.pop(future), future.result()
+
+    def iter_plays(
+        self,
+        prefetch: int = 4,
+        fetch: Optional[List[str]] = None,
+        play_names: Optional[Iterable[str]] = None,
+    ) -> Iterator[Play]:
+        """
+        Iterates over the plays of the corpus in order. While the caller processes 
+            a play, the next plays and the data listed in fetch are downloaded in 
+            background threads. Prefetched data is returned by the first call of the 
+            corresponding Play getter, e.g. play.get_tei() for "tei", without a request.
+            At most prefetch + 1 plays are held in memory.
+        Args:
+            prefetch (int): Number of plays downloaded ahead.
+            fetch (Optional[List[str]]): Play data to download ahead, given by the name 
+                of a Play getter without the prefix "get_", e.g. "tei" or "metrics".
+            play_names (Optional[Iterable[str]]): Names of the plays, defaults to all plays of the corpus.
+        Returns:
+            Iterator[Play]: The plays in order.
+        Raises:
+            PlayNotFound: If one of the play names is not valid in the corpus.
+            ValueError: If one of the names in fetch does not refer to a Play getter.
+        """
+        fetch = _check_fetch(fetch)
+        names = self._play_names(play_names)
+        return _iter_plays(self._api, ((self.name, play_name) for play_name in names), prefetch, fetch, self._raw)
+
+    def get_incidence_matrices(
+        self, play_names: Optional[Iterable[str]] = None, threads: int = 4
+    ) -> Dict[str, Tuple[Any, List[str]]]:
+        """
+        Builds the segment x character incidence matrices of the plays of the corpus,
+            see Play.get_incidence_matrix. Rows of the matrices can be sliced and passed 
+            to pydracor.network.network_metrics to compute windowed or per-act networks
+            locally. Requires numpy and scipy.
+        Args:
+            play_names (Optional[Iterable[str]]): Names of the plays, defaults to all plays of the corpus.
+            threads (int): Number of threads downloading the plays.
+        Returns:
+            Dict[str, Tuple[scipy.sparse.csr_matrix, List[str]]]: Incidence matrix and 
+                character IDs of the columns by play name.
+        Raises:
+            PlayNotFound: If one of the play names is not valid in the corpus.
+        """
+        names = self._play_names(play_names)
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            plays = pool.map(lambda play_name: self._fetch(play_name, [])[0], names)
+            return {play.name: play.get_incidence_matrix() for play in plays}
+
+    def get_local_network_metrics(
+        self, play_names: Optional[Iterable[str]] = None, threads: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Computes the co-occurrence networks and their metrics for the plays of the 
+            corpus locally, see Play.get_local_network_metrics. Requires numpy and scipy.
+        Args:
+            play_names (Optional[Iterable[str]]): Names of the plays, defaults to all plays of the corpus.
+            threads (int): Number of threads downloading the plays.
+        Returns:
+            Dict[str, NetworkMetrics]: Network metrics by play name.
+        Raises:
+            PlayNotFound: If one of the play names is not valid in the corpus.
+        """
+        from .network import network_metrics
+        return {
+            play_name: network_metrics(*incidence)
+            for play_name, incidence in self.get_incidence_matrices(play_names, threads).items()
+        }
+
+    def _play_names(self, play_names: Optional[Iterable[str]]) -> List[str]:
+        """
+        Returns the given play names, or all play names of the corpus if None.
+        Raises PlayNotFound if one of the names is not valid.
+        """
+        valid_names = [play.name for play in self.plays]
+        if play_names is None:
+            return valid_names
+        names = list(play_names)
+        for play_name in names:
+            if play_name not in valid_names:
+                raise PlayNotFound(f"The play name {play_name} is not a valid play name in corpus {self.name}.")
+        return names
+
+    def _fetch(self, play_name: str, fetch: List[str]) -> Tuple[Play, Dict[str, Any]]:
+        """
+        Downloads a play and the requested play data.
+        """
+        play = _load_play(self._api, self.name, play_name, self._raw)
+        return play, {name: getattr(play, f"get_{name}")() for name in fetch}
+
 
+def _prefetchable(getter: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorates a Play getter so that it returns data prefetched by Corpus.iter_plays 
+    once, if it is called without arguments.
+    """
+    name = getter.__name__[len("get_"):]
+
+    @functools.wraps(getter)
+    def wrapper(self, *args, **kwargs):
+        if not args and not kwargs and self._prefetched and name in self._prefetched:
+            return self._prefetched.pop(name)
+        return getter(self, *args, **kwargs)
+    return wrapper
 
-class Play(PlayModel):
+
+class Play(_PicklableApiMixin, PlayModel):
     """
     A class representing a play, extending the PlayModel class and wrapping methods
     to interact with the play's data through the PublicApi.
     Attributes:
         _api (PublicApi): An instance of the PublicApi used to fetch data related to the play.
+        _prefetched (Optional[Dict[str, Any]]): Data downloaded ahead by Corpus.iter_plays, 
+            returned once by the corresponding getter.
+        _raw (bool): Whether the play was created without validation and JSON responses 
+            are returned as plain dicts and lists.
+        _data (Optional[Dict[str, Any]]): The decoded JSON of the play in raw mode.
     """
     _api: PublicApi
+    _prefetched: Optional[Dict[str, Any]] = None
+    _raw: bool = False
+    _data: Optional[Dict[str, Any]] = None
 
     def __init__(self, api: PublicApi, play_model: PlayModel) -> None:
         """
@@ -226,14 +710,63 @@ class Play(PlayModel):
         super().__init__(**play_model.model_dump())
         self._api = api
 
+    @classmethod
+    def _from_json(cls, api: PublicApi, data: Dict[str, Any]) -> Play:
+        """
+        Create a Play instance in raw mode from the decoded JSON of the play, without 
+        validation. The nested data, e.g. characters and segments, remain dicts.
+        """
+        play = cls.model_construct(**data)
+        play._api = api
+        play._raw = True
+        play._data = data
+        return play
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the dictionary representation of the play, the decoded JSON in raw mode.
+        """
+        if self._raw:
+            return self._data
+        return super().to_dict()
+
+    def get_incidence_matrix(self, segments: Optional[Iterable[int]] = None) -> Tuple[Any, List[str]]:
+        """
+        Build the segment x character incidence matrix of the play from its segments,
+        without a request to the API. Requires numpy and scipy.
+        Args:
+            segments (Optional[Iterable[int]]): Numbers of the segments to include, defaults to all segments.
+        Returns:
+            Tuple[scipy.sparse.csr_matrix, List[str]]: The incidence matrix and the character IDs of its columns.
+        """
+        from .network import incidence_matrix
+        return incidence_matrix(self, segments)
+
+    def get_local_network_metrics(self, segments: Optional[Iterable[int]] = None) -> Any:
+        """
+        Compute the co-occurrence network of the play and its metrics (degree, weighted 
+        degree, density, clustering, ...) locally from its segments, without a request 
+        to the API. Requires numpy and scipy.
+        Args:
+            segments (Optional[Iterable[int]]): Numbers of the segments to include, defaults to all segments.
+        Returns:
+            NetworkMetrics: The network and its metrics.
+        """
+        from .network import network_metrics
+        return network_metrics(*self.get_incidence_matrix(segments))
+
+    @_prefetchable
     def get_metrics(self) -> PlayMetrics:
         """
         Retrieve metrics for the play.
         Returns:
-            PlayMetrics: Metrics data for the play.
+            PlayMetrics: Metrics data for the play, a dict in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "play_metrics", self.corpus, self.name)
         return self._api.play_metrics(self.corpus, self.name)
 
+    @_prefetchable
     def get_tei(self) -> str:
         """
         Retrieve the TEI-XML representation of the play.
@@ -242,6 +775,7 @@ class Play(PlayModel):
         """
         return self._api.play_tei(self.corpus, self.name)
     
+    @_prefetchable
     def get_txt(self) -> str:
         """
         Retrieve the plain text representation of the play.
@@ -250,14 +784,18 @@ class Play(PlayModel):
         """
         return self._api.play_txt(self.corpus, self.name)
     
+    @_prefetchable
     def get_characters(self) -> List[Character]:
         """
         Retrieve the list of characters in the play.
         Returns:
-            List[Character]: A list of characters in the play.
+            List[Character]: A list of characters in the play, dicts in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "get_characters", self.corpus, self.name)
         return self._api.get_characters(self.corpus, self.name)
 
+    @_prefetchable
     def get_characters_csv(self) -> str:
         """
         Retrieve the list of characters in the play as a CSV string.
@@ -266,6 +804,20 @@ class Play(PlayModel):
         """
         return self._api.get_characters_csv(self.corpus, self.name)
 
+    def iter_characters_csv(self) -> Iterator[tuple]:
+        """
+        Stream the list of characters in the play in CSV format and parse it row by row.
+        The records are namedtuples with the CSV columns in snake case as fields. The 
+        values of each column have the type of the corresponding Character field (int, 
+        float or bool), other columns are strings; missing values are None. The request 
+        is sent when the first record is requested.
+        Returns:
+            Iterator[tuple]: Records of the characters in the play.
+        """
+        with _stream_requests():
+            response = self._api.get_characters_csv_without_preload_content(self.corpus, self.name)
+        yield from iter_csv_records(response, type_name="CharacterRecord", column_types=_column_types(Character))
+
     def get_networkdata(self, download_format: DownloadFormat) -> str:
         """
         Retrieve network data for the play in the specified format.
@@ -285,6 +837,19 @@ class Play(PlayModel):
         else:
             raise ValueError(f"The download_format {download_format} is invalid. It must be one of: {', '.join([df.value for df in DownloadFormat])}")
 
+    def iter_networkdata_csv(self) -> Iterator[NetworkEdge]:
+        """
+        Stream the network data for the play in CSV format and parse it row by row.
+        The request is sent when the first edge is requested.
+        Returns:
+            Iterator[NetworkEdge]: The edges of the co-occurrence network.
+        Raises:
+            ValueError: If the CSV columns do not match NetworkEdge.
+        """
+        with _stream_requests():
+            response = self._api.network_csv_without_preload_content(self.corpus, self.name)
+        yield from iter_csv_records(response, NetworkEdge)
+
     def get_relations(self, download_format: DownloadFormat) -> str:
         """
         Retrieve relations data for the play in the specified format.
@@ -304,6 +869,20 @@ class Play(PlayModel):
         else:
             raise ValueError(f"The download_format {download_format} is invalid. It must must be one of: {', '.join([df.value for df in DownloadFormat])}")
 
+    def iter_relations_csv(self) -> Iterator[Relation]:
+        """
+        Stream the relations data for the play in CSV format and parse it row by row.
+        The request is sent when the first relation is requested.
+        Returns:
+            Iterator[Relation]: The relations between the characters.
+        Raises:
+            ValueError: If the CSV columns do not match Relation.
+        """
+        with _stream_requests():
+            response = self._api.relations_csv_without_preload_content(self.corpus, self.name)
+        yield from iter_csv_records(response, Relation)
+
+    @_prefetchable
     def get_spoken_text(
         self,
         sex: Optional[str] = None,
@@ -329,14 +908,18 @@ class Play(PlayModel):
             self.corpus, self.name, sex, role, relation, relation_active, relation_passive 
         )
 
+    @_prefetchable
     def get_spoken_text_by_character(self) -> List[SpokenTextByCharacter]:
         """
         Retrieve the spoken text in the play grouped by character.
         Returns:
-            List[SpokenTextByCharacter]: A list of spoken text grouped by character.
+            List[SpokenTextByCharacter]: A list of spoken text grouped by character, dicts in raw mode.
         """
+        if self._raw:
+            return _get_json(self._api, "play_spoken_text_by_character", self.corpus, self.name)
         return self._api.play_spoken_text_by_character(self.corpus, self.name)
 
+    @_prefetchable
     def get_stage_directions(self) -> str:
         """
         Retrieve the stage directions in the play.
@@ -345,6 +928,7 @@ class Play(PlayModel):
         """
         return self._api.play_stage_directions(self.corpus, self.name)
 
+    @_prefetchable
     def get_stage_directions_with_speakers(self) -> str:
         """
         Retrieve the stage directions and the spoken text of the play.
@@ -354,6 +938,59 @@ class Play(PlayModel):
         return self._api.play_stage_directions_with_speakers(self.corpus, self.name)
     
 
+# Play getters without arguments that can be requested in Corpus.map
+_FETCHABLE = [
+    "metrics",
+    "tei",
+    "txt",
+    "characters",
+    "characters_csv",
+    "spoken_text",
+    "spoken_text_by_character",
+    "stage_directions",
+    "stage_directions_with_speakers",
+]
+
+
+def _check_fetch(fetch: Optional[List[str]]) -> List[str]:
+    """
+    Validates the names of the play data to download ahead.
+    Raises ValueError if a name does not refer to a Play getter.
+    """
+    fetch = list(fetch or [])
+    for name in fetch:
+        if name not in _FETCHABLE:
+            raise ValueError(f"The value {name} is invalid for fetch. It must be one of: {', '.join(_FETCHABLE)}")
+    return fetch
+
+
+def _iter_plays(
+    api: PublicApi, play_keys: Iterator[Tuple[str, str]], prefetch: int, fetch: List[str], raw: bool = False
+) -> Iterator[Play]:
+    """
+    Yields the plays given by (corpus name, play name) in order, downloading
+    the next prefetch plays and their requested data in background threads.
+    """
+    def download(corpus_name: str, play_name: str) -> Play:
+        play = _load_play(api, corpus_name, play_name, raw)
+        play._prefetched = {name: getattr(play, f"get_{name}")() for name in fetch}
+        return play
+
+    in_flight = deque()
+    pool = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+    try:
+        for corpus_name, play_name in play_keys:
+            in_flight.append(pool.submit(download, corpus_name, play_name))
+            if len(in_flight) > prefetch:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
 class Wikidata:
     """
     A wrapper class for interacting with DraCor Wikidata endpoints.
@@ -366,13 +1003,16 @@ class Wikidata:
             interact with the Wikidata API.
     """
 
-    def __init__(self, api_client=None) -> None:
+    def __init__(self, api_client=None, coalesce=True, transport=None) -> None:
         """
         Initializes the Wikidata wrapper with an optional API client.
         Args:
             api_client: An optional API client instance to use for requests.
+            coalesce (bool): Whether concurrent identical requests share one HTTP request 
+                and its result. Defaults to True.
+            transport: An optional transport for the HTTP requests, e.g. HTTPXTransport for HTTP/2.
         """
-        self._api = WikidataApi(api_client)
+        self._api = WikidataApi(_build_api_client(api_client, coalesce=coalesce, transport=transport))
 
     def get_author_info(self, wikidata_id: str) -> dict:
         """
@@ -402,18 +1042,19 @@ class DTS:
         _api (DTSApi): An instance of the `DTSApi` class used to interact with the DTS API.
     """
 
-    def __init__(self, api_client=None, host=None) -> None:
+    def __init__(self, api_client=None, host=None, coalesce=True, transport=None) -> None:
         """
         Initializes the DTS wrapper with an optional API client or host.
 
         Args:
             api_client: An optional API client instance to use for requests.
-            host: An optional host URL to configure the API client.
+            host: An optional host URL to configure the API client, or a list of host URLs 
+                distributing the requests by a HostPool.
+            coalesce (bool): Whether concurrent identical requests share one HTTP request 
+                and its result. Defaults to True.
+            transport: An optional transport for the HTTP requests, e.g. HTTPXTransport for HTTP/2.
         """
-        if host:
-            configuration = Configuration(host=host)
-            api_client = ApiClient(configuration=configuration)
-        self._api = DTSApi(api_client)
+        self._api = DTSApi(_build_api_client(api_client, host, coalesce, transport))
     
     def get_dts(self) -> DtsEntrypoint:
         """
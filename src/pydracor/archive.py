@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .api_wrapper import Corpus, PlayNotFound
+
+# Layout of an archive file:
+#   magic, offset and length of the index, length of the dictionary (header)
+#   dictionary
+#   one zstd frame per play and format, compressed with the dictionary
+#   index: zstd compressed JSON mapping play names and formats to frames
+_MAGIC = b"DRACORZ1"
+_HEADER = struct.Struct("<8sQQQ")
+
+
+class TEIArchive:
+    """
+    A compressed local store of the TEI (and optionally plain text) of the plays of
+    a corpus. All payloads of a corpus are written to a single archive file, each
+    compressed with zstd using a dictionary trained on the TEI of the corpus. The
+    payloads of single plays can be read without decompressing the rest of the archive.
+
+    Requires the optional dependency zstandard (pip install pydracor[zstd]).
+
+    Attributes:
+        path (str): Path of the archive file.
+        corpus (str): Name of the archived corpus.
+        formats (List[str]): Archived formats, "tei" and/or "txt".
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens an existing archive for reading.
+        Args:
+            path (str): Path of the archive file.
+        Raises:
+            ImportError: If zstandard is not installed.
+            ValueError: If the file is not a valid archive.
+        """
+        _require_zstandard()
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            index = self._read_index()
+        except BaseException:
+            self._mmap.close()
+            raise
+        self.corpus: str = index["corpus"]
+        self.formats: List[str] = index["formats"]
+        self._frames: Dict[str, Dict[str, Tuple[int, int]]] = index["plays"]
+        # decompressors must not be shared between threads
+        self._local = threading.local()
+
+    def _read_index(self) -> Dict[str, Any]:
+        """
+        Reads the header, the dictionary and the index of the archive.
+        """
+        try:
+            magic, index_offset, index_length, dict_length = _HEADER.unpack_from(self._mmap)
+        except struct.error as e:
+            raise ValueError(f"The file {self.path} is not a valid TEI archive") from e
+        if magic != _MAGIC:
+            raise ValueError(f"The file {self.path} is not a valid TEI archive")
+        self._dict = zstandard.ZstdCompressionDict(self._mmap[_HEADER.size:_HEADER.size + dict_length])
+        return json.loads(zstandard.ZstdDecompressor().decompress(
+            self._mmap[index_offset:index_offset + index_length]
+        ))
+
+    @classmethod
+    def create(
+        cls,
+        corpus: Corpus,
+        path: str,
+        formats: Iterable[str] = ("tei",),
+        play_names: Optional[Iterable[str]] = None,
+        level: int = 19,
+        dict_size: int = 112640,
+        training_plays: int = 50,
+        threads: int = 4,
+    ) -> TEIArchive:
+        """
+        Downloads the plays of a corpus and writes them to a new archive. The
+        dictionary is trained on the TEI (the plain text, if only "txt" is archived)
+        of the first training_plays plays, which are kept in memory until training
+        is done; all other plays are compressed as they arrive.
+        Args:
+            corpus (Corpus): The corpus to archive.
+            path (str): Path of the archive file, an existing file is overwritten.
+            formats (Iterable[str]): Formats to archive, "tei" and/or "txt".
+            play_names (Optional[Iterable[str]]): Names of the plays to archive, defaults to all plays of the corpus.
+            level (int): zstd compression level.
+            dict_size (int): Maximum size of the dictionary in bytes.
+            training_plays (int): Number of plays the dictionary is trained on.
+            threads (int): Number of threads downloading plays.
+        Returns:
+            TEIArchive: The archive opened for reading.
+        Raises:
+            ImportError: If zstandard is not installed.
+            ValueError: If one of the formats is invalid.
+            PlayNotFound: If one of the play names is not valid in the corpus.
+        """
+        _require_zstandard()
+        formats = list(formats)
+        for fmt in formats:
+            if fmt not in ("tei", "txt"):
+                raise ValueError(f"The format {fmt} is invalid. It must be one of: tei, txt")
+        valid_names = [play.name for play in corpus.plays]
+        names = valid_names if play_names is None else list(play_names)
+        for play_name in names:
+            if play_name not in valid_names:
+                raise PlayNotFound(f"The play name {play_name} is not a valid play name in corpus {corpus.name}.")
+
+        payloads = _download(corpus, names, formats, threads)
+        training = [next(payloads) for _ in range(min(training_plays, len(names)))]
+        training_format = "tei" if "tei" in formats else "txt"
+        dictionary = _train_dictionary([payload[training_format] for _, payload in training], dict_size)
+        compressor = zstandard.ZstdCompressor(level=level, dict_data=dictionary, write_content_size=True)
+
+        index = {"corpus": corpus.name, "formats": formats, "plays": {}}
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                dict_bytes = dictionary.as_bytes()
+                f.write(_HEADER.pack(_MAGIC, 0, 0, len(dict_bytes)))
+                f.write(dict_bytes)
+                for play_name, payload in chain(training, payloads):
+                    frames = index["plays"][play_name] = {}
+                    for fmt, text in payload.items():
+                        frame = compressor.compress(text)
+                        frames[fmt] = (f.tell(), len(frame))
+                        f.write(frame)
+                index_bytes = zstandard.ZstdCompressor(level=level).compress(json.dumps(index).encode("utf-8"))
+                index_offset = f.tell()
+                f.write(index_bytes)
+                f.seek(0)
+                f.write(_HEADER.pack(_MAGIC, index_offset, len(index_bytes), len(dict_bytes)))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def __enter__(self) -> TEIArchive:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __contains__(self, play_name: str) -> bool:
+        return play_name in self._frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def close(self) -> None:
+        """
+        Closes the archive file.
+        """
+        self._mmap.close()
+
+    def play_names(self) -> List[str]:
+        """
+        Retrieves the names of the archived plays.
+        Returns:
+            List[str]: Names of the plays in the archive.
+        """
+        return list(self._frames)
+
+    def get_tei(self, play_name: str) -> str:
+        """
+        Retrieves the TEI-XML of a play from the archive.
+        Args:
+            play_name (str): Name of the play.
+        Returns:
+            str: The TEI-XML representation of the play.
+        Raises:
+            PlayNotFound: If the play is not in the archive.
+            ValueError: If the TEI was not archived.
+        """
+        return self._read(play_name, "tei")
+
+    def get_txt(self, play_name: str) -> str:
+        """
+        Retrieves the plain text of a play from the archive.
+        Args:
+            play_name (str): Name of the play.
+        Returns:
+            str: The plain text representation of the play.
+        Raises:
+            PlayNotFound: If the play is not in the archive.
+            ValueError: If the plain text was not archived.
+        """
+        return self._read(play_name, "txt")
+
+    def _read(self, play_name: str, fmt: str) -> str:
+        """
+        Decompresses the frame of a play in the given format.
+        """
+        if play_name not in self._frames:
+            raise PlayNotFound(f"The play name {play_name} is not in the archive of corpus {self.corpus}.")
+        if fmt not in self.formats:
+            raise ValueError(f"The format {fmt} was not archived. Archived formats: {', '.join(self.formats)}")
+        offset, length = self._frames[play_name][fmt]
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor(dict_data=self._dict)
+        return decompressor.decompress(self._mmap[offset:offset + length]).decode("utf-8")
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError("TEIArchive requires zstandard, install it with: pip install pydracor[zstd]")
+
+
+def _download(
+    corpus: Corpus, names: List[str], formats: List[str], threads: int
+) -> Iterator[Tuple[str, Dict[str, bytes]]]:
+    """
+    Downloads the payloads of the plays in order, with at most 2 * threads plays
+    downloaded ahead.
+    """
+    def fetch(play_name: str) -> Dict[str, bytes]:
+        # only the payloads are needed, not the play itself
+        return {fmt: getattr(corpus._api, f"play_{fmt}")(corpus.name, play_name).encode("utf-8") for fmt in formats}
+
+    queue = deque(names)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        in_flight = deque()
+        while queue or in_flight:
+            while queue and len(in_flight) < 2 * threads:
+                play_name = queue.popleft()
+                in_flight.append((play_name, pool.submit(fetch, play_name)))
+            play_name, future = in_flight.popleft()
+            yield play_name, future.result()
+
+
+def _train_dictionary(documents: List[bytes], dict_size: int, chunk_size: int = 16384):
+    """
+    Trains a zstd dictionary on the TEI of a corpus. The documents are split into
+    chunks, as the trainer needs many samples that are small compared to the
+    dictionary. Falls back to an empty (raw content) dictionary if there is not
+    enough data to train on.
+    """
+    samples = [document[i:i + chunk_size] for document in documents for i in range(0, len(document), chunk_size)]
+    try:
+        return zstandard.train_dictionary(dict_size, samples)
+    except zstandard.ZstdError:
+        return zstandard.ZstdCompressionDict(b"".join(samples)[:dict_size], dict_type=zstandard.DICT_TYPE_RAWCONTENT)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    np = None
+    sparse = None
+
+if TYPE_CHECKING:
+    from .api_wrapper import Play
+
+
+@dataclass
+class NetworkMetrics:
+    """
+    Co-occurrence network of the characters of a play and its metrics, computed
+    locally from the segments of the play. Two characters are connected if they
+    speak in the same segment, the weight of the edge is the number of segments
+    they share. The names of the metrics follow PlayMetrics.
+
+    Attributes:
+        character_ids (List[str]): IDs of the characters, the order of the nodes.
+        adjacency (sparse.csr_matrix): Weighted adjacency matrix of the network.
+        degree (np.ndarray): Degree of each node.
+        weighted_degree (np.ndarray): Weighted degree of each node.
+        clustering (np.ndarray): Local clustering coefficient of each node.
+        size (int): Number of nodes.
+        num_edges (int): Number of edges.
+        density (float): Density of the network.
+        average_degree (float): Average degree of the nodes.
+        average_clustering (float): Average local clustering coefficient.
+        max_degree (int): Maximum degree.
+        max_degree_ids (List[str]): IDs of the characters with the maximum degree.
+        num_connected_components (int): Number of connected components.
+    """
+    character_ids: List[str]
+    adjacency: "sparse.csr_matrix"
+    degree: "np.ndarray"
+    weighted_degree: "np.ndarray"
+    clustering: "np.ndarray"
+    size: int
+    num_edges: int
+    density: float
+    average_degree: float
+    average_clustering: float
+    max_degree: int
+    max_degree_ids: List[str]
+    num_connected_components: int
+
+
+def incidence_matrix(
+    play: Play, segments: Optional[Iterable[int]] = None
+) -> Tuple["sparse.csr_matrix", List[str]]:
+    """
+    Builds the segment x character incidence matrix of a play. The entry of a
+    segment and a character is 1 if the character speaks in the segment.
+    Args:
+        play (Play): The play, its segments and characters are used, no request is sent.
+        segments (Optional[Iterable[int]]): Numbers of the segments to include, e.g. the
+            segments of one act, defaults to all segments.
+    Returns:
+        Tuple[sparse.csr_matrix, List[str]]: The incidence matrix with one row per
+            segment in the order of the play and the character IDs of the columns.
+    Raises:
+        ImportError: If numpy or scipy is not installed.
+    """
+    _require_scipy()
+    character_ids = [_field(character, "id") for character in play.characters]
+    columns = {character_id: i for i, character_id in enumerate(character_ids)}
+    selected = None if segments is None else set(segments)
+    rows, cols = [], []
+    num_rows = 0
+    for segment in play.segments:
+        if selected is not None and _field(segment, "number") not in selected:
+            continue
+        for speaker in set(_field(segment, "speakers") or []):
+            if speaker not in columns:
+                columns[speaker] = len(character_ids)
+                character_ids.append(speaker)
+            rows.append(num_rows)
+            cols.append(columns[speaker])
+        num_rows += 1
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(num_rows, len(character_ids)),
+    )
+    return matrix, character_ids
+
+
+def network_metrics(incidence: "sparse.spmatrix", character_ids: List[str]) -> NetworkMetrics:
+    """
+    Computes the co-occurrence network and its metrics from an incidence matrix.
+    Rows of the matrix can be sliced beforehand to compute the network of a
+    window of segments.
+    Args:
+        incidence (sparse.spmatrix): Segment x character incidence matrix.
+        character_ids (List[str]): Character IDs of the columns.
+    Returns:
+        NetworkMetrics: The network and its metrics.
+    Raises:
+        ImportError: If numpy or scipy is not installed.
+    """
+    _require_scipy()
+    incidence = sparse.csr_matrix(incidence, dtype=np.int64)
+    adjacency = (incidence.T @ incidence).tocsr()
+    adjacency.setdiag(0)
+    adjacency.eliminate_zeros()
+    binary = (adjacency > 0).astype(np.int64)
+
+    size = adjacency.shape[0]
+    degree = np.asarray(binary.sum(axis=1)).ravel()
+    weighted_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    num_edges = int(degree.sum()) // 2
+    # twice the number of triangles of each node
+    triangles = np.asarray((binary @ binary).multiply(binary).sum(axis=1)).ravel()
+    possible = degree * (degree - 1)
+    clustering = np.divide(triangles, possible, out=np.zeros(size), where=possible > 0)
+    max_degree = int(degree.max()) if size else 0
+
+    return NetworkMetrics(
+        character_ids=list(character_ids),
+        adjacency=adjacency,
+        degree=degree,
+        weighted_degree=weighted_degree,
+        clustering=clustering,
+        size=size,
+        num_edges=num_edges,
+        density=2 * num_edges / (size * (size - 1)) if size > 1 else 0.0,
+        average_degree=float(degree.mean()) if size else 0.0,
+        average_clustering=float(clustering.mean()) if size else 0.0,
+        max_degree=max_degree,
+        max_degree_ids=[character_ids[i] for i in np.flatnonzero(degree == max_degree)] if size else [],
+        num_connected_components=int(connected_components(binary, directed=False)[0]) if size else 0,
+    )
+
+
+def _field(item: Any, name: str) -> Any:
+    """
+    Returns a field of a model, or of a dict for plays in raw mode.
+    """
+    return item.get(name) if isinstance(item, dict) else getattr(item, name)
+
+
+def _require_scipy() -> None:
+    if np is None:
+        raise ImportError("Network metrics require numpy and scipy, install them with: pip install pydracor[network]")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+from pydracor_base.exceptions import ApiException
+from pydracor_base.rest import RESTResponse
+
+from .transport import HTTPXResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decodes JSON with orjson if it is installed, else with the json module.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(response) -> Any:
+    """
+    Reads and decodes a JSON response of the API without validating it.
+    Args:
+        response: A response returned by a *_without_preload_content method of the API.
+    Returns:
+        Any: The decoded JSON, e.g. a dict or a list of dicts.
+    Raises:
+        ApiException: If the response has an error status.
+    """
+    http_resp = _http_response(response)
+    data = http_resp.read()
+    if not 200 <= http_resp.status <= 299:
+        raise ApiException.from_response(http_resp=http_resp, body=data.decode("utf-8"), data=None)
+    return loads(data)
+
+
+def _http_response(response):
+    """
+    Wraps a response returned by a *_without_preload_content method, i.e. a urllib3
+    response of the default client or an httpx response of HTTPXTransport, in the
+    RESTResponse interface of pydracor-base.
+    """
+    if isinstance(response, io.IOBase):
+        return RESTResponse(response)
+    return HTTPXResponse(response)
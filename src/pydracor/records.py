@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import csv
+import functools
+import io
+import re
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Type, get_args, get_type_hints
+
+from pydantic import BaseModel
+from pydracor_base.exceptions import ApiException
+
+from .raw import _http_response
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_CAMEL_CASE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+# requests of the current thread which must not be buffered, see _CoalescingRESTClient
+_streaming = threading.local()
+
+
+class NetworkEdge(NamedTuple):
+    """
+    An edge of the co-occurrence network of a play, a row of the network data CSV.
+    """
+    source: str
+    type: str
+    target: str
+    weight: int
+
+
+class Relation(NamedTuple):
+    """
+    A relation between two characters of a play, a row of the relations CSV.
+    """
+    source: str
+    type: str
+    target: str
+    label: str
+
+
+@contextmanager
+def _stream_requests():
+    """
+    Marks the requests sent by the current thread within the context as streamed,
+    so that they are not buffered for coalescing.
+    """
+    _streaming.active = True
+    try:
+        yield
+    finally:
+        _streaming.active = False
+
+
+def _is_streaming() -> bool:
+    """
+    Returns whether the current thread sends a streamed request.
+    """
+    return getattr(_streaming, "active", False)
+
+
+def iter_csv_records(
+    response,
+    record_type: Optional[Type[tuple]] = None,
+    type_name: str = "Record",
+    column_types: Optional[Dict[str, type]] = None,
+) -> Iterator[tuple]:
+    """
+    Parses a CSV response of the API row by row while it is downloaded.
+    Args:
+        response: A response returned by a *_without_preload_content method of the API, 
+            i.e. a urllib3 or, with HTTPXTransport, an httpx response.
+        record_type (Optional[Type[tuple]]): NamedTuple the rows are converted to, its fields 
+            must match the header of the CSV. If None, a namedtuple named type_name is 
+            created from the header, with the column names in snake case as fields.
+        type_name (str): Name of the created namedtuple.
+        column_types (Optional[Dict[str, type]]): Types of the columns of the created 
+            namedtuple by column name, see convert_value. Other columns remain strings.
+    Returns:
+        Iterator[tuple]: The records of the rows.
+    Raises:
+        ApiException: If the response has an error status.
+        ValueError: If the header does not match the fields of record_type, or a value 
+            cannot be converted to the type of its column.
+    """
+    rows = _iter_csv_rows(response)
+    try:
+        header = next(rows, None)
+        if header is None:
+            return
+        if record_type is None:
+            record_type = namedtuple(type_name, [_snake_case(name) for name in header], rename=True)
+            types = [(column_types or {}).get(name, str) for name in header]
+        else:
+            if [name.lower() for name in header] != [field.lower() for field in record_type._fields]:
+                raise ValueError(f"The CSV header {header} does not match the fields of {record_type.__name__}")
+            hints = get_type_hints(record_type)
+            types = [hints[field] for field in record_type._fields]
+        for row in rows:
+            yield record_type._make(convert_value(value, value_type) for value, value_type in zip(row, types))
+    finally:
+        # releases or closes the connection, also if the records are not read to the end
+        rows.close()
+
+
+def convert_value(value: str, value_type: type = str) -> Any:
+    """
+    Converts a CSV value to the type of its column: empty values to None, values
+    of int, float and bool columns (true or false) to these types; values of all
+    other columns remain strings.
+    """
+    if value == "":
+        return None
+    if value_type is bool:
+        return value.lower() == "true"
+    if value_type is int or value_type is float:
+        return value_type(value)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _column_types(model: Type[BaseModel]) -> Dict[str, type]:
+    """
+    Returns the types of the CSV columns by column name, derived from the fields of
+    the pydracor-base model with the same JSON keys, e.g. PlayMetadata for the
+    metadata CSV.
+    """
+    types = {}
+    for name, field in model.model_fields.items():
+        base_types = _base_types(field.annotation)
+        for value_type in (float, int, bool):
+            if value_type in base_types:
+                types[field.alias or name] = value_type
+                break
+    return types
+
+
+def _base_types(annotation: Any) -> set:
+    """
+    Returns the plain types of an annotation, unwrapping Optional, Union and Annotated.
+    """
+    if isinstance(annotation, type):
+        return {annotation}
+    args = get_args(annotation)
+    if not args:
+        return set()
+    if getattr(annotation, "__metadata__", None) is not None:
+        # Annotated, e.g. StrictInt
+        return _base_types(args[0])
+    return set().union(*(_base_types(arg) for arg in args))
+
+
+def records_to_arrays(records: Iterable[tuple]) -> Dict[str, "np.ndarray"]:
+    """
+    Collects records into one NumPy array per field. Integer fields with missing
+    values become float arrays with NaN, fields of other mixed types object arrays.
+    Args:
+        records (Iterable[tuple]): NamedTuple records, e.g. from Corpus.iter_metadata_csv.
+    Returns:
+        Dict[str, np.ndarray]: The arrays by field name.
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError("records_to_arrays requires numpy, install it with: pip install pydracor[network]")
+    columns: Optional[List[list]] = None
+    fields: List[str] = []
+    for record in records:
+        if columns is None:
+            fields = list(record._fields)
+            columns = [[] for _ in fields]
+        for column, value in zip(columns, record):
+            column.append(value)
+    return {field: _to_array(column) for field, column in zip(fields, columns or [])}
+
+
+def _to_array(column: list) -> "np.ndarray":
+    types = {type(value) for value in column if value is not None}
+    has_missing = any(value is None for value in column)
+    if types <= {int, float} and types:
+        if has_missing or float in types:
+            return np.array([np.nan if value is None else value for value in column], dtype=np.float64)
+        return np.array(column, dtype=np.int64)
+    if types == {bool} and not has_missing:
+        return np.array(column, dtype=bool)
+    return np.array(column, dtype=object)
+
+
+def _iter_csv_rows(response) -> Iterator[List[str]]:
+    """
+    Yields the rows of a CSV response. Responses of the default urllib3 client are
+    decoded while they are read; responses of HTTPXTransport are already read and
+    parsed from memory.
+    """
+    streamed = isinstance(response, io.IOBase)
+    http_resp = _http_response(response)
+    if not 200 <= http_resp.status <= 299:
+        http_resp.read()
+        raise ApiException.from_response(http_resp=http_resp, body=http_resp.data.decode("utf-8"), data=None)
+    if not streamed:
+        yield from csv.reader(io.StringIO(http_resp.read().decode("utf-8"), newline=""))
+        return
+    # keeps the response readable at the end of the body, as required by TextIOWrapper
+    response.auto_close = False
+    exhausted = False
+    try:
+        yield from csv.reader(io.TextIOWrapper(response, encoding="utf-8", newline=""))
+        exhausted = True
+    finally:
+        if exhausted:
+            response.release_conn()
+        else:
+            # the connection cannot be reused with unread data
+            response.close()
+
+
+def _snake_case(name: str) -> str:
+    return _CAMEL_CASE.sub("_", name).lower()
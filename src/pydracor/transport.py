@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import urllib3
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# errors of a host which are retried on the next host of a HostPool
+_CONNECTION_ERRORS: Tuple[type, ...] = (urllib3.exceptions.HTTPError, OSError)
+if httpx is not None:
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class HTTPXResponse:
+    """
+    Adapts an httpx response to the interface of the RESTResponse of pydracor-base,
+    which the generated API classes deserialize.
+
+    Attributes:
+        response (httpx.Response): The wrapped response.
+        status (int): HTTP status code.
+        reason (str): HTTP reason phrase.
+        data (Optional[bytes]): Body of the response, set by read().
+    """
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = None
+
+    def read(self) -> bytes:
+        if self.data is None:
+            self.data = self.response.read()
+        return self.data
+
+    def getheaders(self) -> Dict[str, str]:
+        """Returns a dictionary of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class HTTPXTransport:
+    """
+    Transport for DraCorAPI, DTS and Wikidata based on httpx, replacing the urllib3
+    client of pydracor-base. With HTTP/2, concurrent requests, e.g. from several
+    threads sharing one DraCorAPI instance, are multiplexed over a single connection.
+    The transport is thread-safe; from asyncio code, wrapper methods can be run with
+    asyncio.to_thread and still share the connection.
+
+    Requires the optional dependency httpx (pip install pydracor[http2]).
+
+    Attributes:
+        client (httpx.Client): The httpx client sending the requests.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        verify: bool = True,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        client: Optional["httpx.Client"] = None,
+    ) -> None:
+        """
+        Initializes the transport with a new or the given httpx client.
+        Args:
+            http2 (bool): Whether to use HTTP/2. It is negotiated for https hosts; for
+                http hosts, HTTP/2 is only used if http1 is False (prior knowledge).
+            http1 (bool): Whether to allow HTTP/1.1.
+            verify (bool): Whether to verify TLS certificates.
+            timeout (Optional[float]): Default timeout of the requests in seconds, None for no timeout.
+            max_connections (Optional[int]): Maximum number of connections, None for no limit.
+            client (Optional[httpx.Client]): An httpx client to use instead of creating one.
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError("HTTPXTransport requires httpx, install it with: pip install pydracor[http2]")
+        self.client = client or httpx.Client(
+            http1=http1,
+            http2=http2,
+            verify=verify,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    def __enter__(self) -> HTTPXTransport:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connections of the transport.
+        """
+        self.client.close()
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None) -> HTTPXResponse:
+        """
+        Performs a request, with the signature of RESTClientObject.request of pydracor-base.
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            headers (Optional[dict]): Request headers.
+            body: Request body, serialized as JSON unless it is a str or bytes.
+            post_params: Form parameters.
+            _request_timeout: Total timeout or a tuple of (connection, read) timeouts.
+        Returns:
+            HTTPXResponse: The response.
+        """
+        content = None
+        if body is not None:
+            content = body if isinstance(body, (str, bytes)) else json.dumps(body)
+        response = self.client.request(
+            method.upper(),
+            url,
+            headers=headers,
+            content=content,
+            data=dict(post_params) if post_params else None,
+            timeout=self._timeout(_request_timeout),
+        )
+        return HTTPXResponse(response)
+
+    def _timeout(self, request_timeout):
+        """
+        Converts a pydracor-base request timeout to an httpx timeout.
+        """
+        if not request_timeout:
+            return httpx.USE_CLIENT_DEFAULT
+        if isinstance(request_timeout, tuple):
+            connect, read = request_timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(request_timeout)
+
+
+@dataclass
+class _HostState:
+    """
+    Observed state of a host of a HostPool.
+    """
+    latency: Optional[float] = None
+    failures: int = 0
+    down_until: float = 0.0
+
+
+class HostPool:
+    """
+    Transport for DraCorAPI and DTS distributing the requests over several hosts 
+    serving the same API, e.g. a pool of self-hosted DraCor instances. Each request 
+    is sent to the available host with the lowest latency, estimated as the 
+    exponentially weighted moving average (EWMA) of its response times; hosts 
+    without measurement are tried first. If a host cannot be reached, times out or 
+    answers with a server error (5xx), it is marked as down for the cooldown period 
+    and idempotent requests are retried on the next host. Hosts marked as down are 
+    tried again after the cooldown, or earlier by a successful health check.
+
+    The hosts are given as base URLs like the host of DraCorAPI, e.g. 
+    "http://localhost:8088/api/v1". Requests are sent by an inner transport, the 
+    urllib3 client of pydracor-base or e.g. HTTPXTransport. The pool is thread-safe.
+
+    Attributes:
+        hosts (List[str]): The base URLs of the hosts, the first one is the host 
+            configured in the API client.
+        transport: The inner transport sending the requests.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        transport=None,
+        alpha: float = 0.3,
+        cooldown: float = 30.0,
+        connect_timeout: Optional[float] = 3.0,
+        read_timeout: Optional[float] = 30.0,
+        health_path: str = "/info",
+        health_interval: Optional[float] = None,
+    ) -> None:
+        """
+        Initializes the pool of hosts.
+        Args:
+            hosts (Sequence[str]): The base URLs of the hosts.
+            transport: An optional transport with the method request of RESTClientObject, 
+                defaults to the urllib3 client of pydracor-base without retries. A given 
+                transport should not retry failed requests itself, as each retry delays 
+                the failover.
+            alpha (float): Weight of the latest response time in the EWMA, between 0 and 1.
+            cooldown (float): Seconds a failed host is skipped.
+            connect_timeout (Optional[float]): Timeout of connecting to a host in seconds, 
+                used for requests without a timeout. None for no timeout.
+            read_timeout (Optional[float]): Timeout of waiting for data from a host in 
+                seconds, used for requests without a timeout. None for no timeout.
+            health_path (str): Path of the endpoint requested by the health checks.
+            health_interval (Optional[float]): If set, the hosts are checked in a background 
+                thread every health_interval seconds.
+        Raises:
+            ValueError: If no host is given or alpha is not in (0, 1].
+        """
+        if not hosts:
+            raise ValueError("A HostPool requires at least one host")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.hosts: List[str] = [host.rstrip("/") for host in hosts]
+        if transport is None:
+            from pydracor_base.configuration import Configuration
+            from pydracor_base.rest import RESTClientObject
+            # failed requests are retried on the next host by the pool, not on the same host
+            retries = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0)
+            transport = RESTClientObject(Configuration(host=self.hosts[0], retries=retries))
+        self.transport = transport
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.timeout = (connect_timeout, read_timeout)
+        self.health_path = health_path
+        self._states = {host: _HostState() for host in self.hosts}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._health_thread = None
+        if health_interval:
+            self._health_thread = threading.Thread(
+                target=self._check_periodically, args=(health_interval,), daemon=True
+            )
+            self._health_thread.start()
+
+    def __enter__(self) -> HostPool:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the health checks and closes the inner transport, if it can be closed.
+        """
+        self._closed.set()
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        """
+        Performs a request on the best available host, with the signature of 
+        RESTClientObject.request of pydracor-base. Idempotent requests are retried 
+        on the other hosts if a host fails.
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request, starting with one of the hosts.
+            headers (Optional[dict]): Request headers.
+            body: Request body.
+            post_params: Form parameters.
+            _request_timeout: Total timeout or a tuple of (connection, read) timeouts.
+        Returns:
+            The response of the inner transport.
+        Raises:
+            Exception: The error of the last host, if all hosts failed with a connection error.
+        """
+        path = self._path(url)
+        if path is None:
+            # not an URL of the pool, e.g. of another API
+            return self.transport.request(
+                method, url, headers=headers, body=body, post_params=post_params, _request_timeout=_request_timeout
+            )
+        hosts = self._ranked_hosts()
+        if method.upper() not in _IDEMPOTENT_METHODS:
+            hosts = hosts[:1]
+        error = None
+        response = None
+        for host in hosts:
+            start = time.perf_counter()
+            try:
+                response = self.transport.request(
+                    method,
+                    host + path,
+                    headers=headers,
+                    body=body,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout or self.timeout,
+                )
+            except _CONNECTION_ERRORS as e:
+                self._mark_down(host)
+                error = e
+                continue
+            if response.status >= 500:
+                self._mark_down(host)
+                if host != hosts[-1]:
+                    # releases the connection of the discarded response
+                    response.read()
+                continue
+            self._record(host, time.perf_counter() - start)
+            return response
+        if response is not None:
+            return response
+        raise error
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Requests the health endpoint of each host and updates its state.
+        Returns:
+            Dict[str, bool]: Whether each host is available.
+        """
+        result = {}
+        for host in self.hosts:
+            start = time.perf_counter()
+            try:
+                response = self.transport.request("GET", host + self.health_path, _request_timeout=self.timeout)
+                response.read()
+                healthy = response.status < 500
+            except _CONNECTION_ERRORS:
+                healthy = False
+            if healthy:
+                self._record(host, time.perf_counter() - start)
+            else:
+                self._mark_down(host)
+            result[host] = healthy
+        return result
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the observed state of each host.
+        Returns:
+            Dict[str, Dict[str, Any]]: For each host, whether it is available, its 
+                EWMA latency in seconds (None if not measured yet) and its number 
+                of consecutive failures.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "available": state.down_until <= now,
+                    "latency": state.latency,
+                    "failures": state.failures,
+                }
+                for host, state in self._states.items()
+            }
+
+    def _path(self, url: str) -> Optional[str]:
+        """
+        Returns the part of the URL following the host, None if it does not start with a host of the pool.
+        """
+        for host in self.hosts:
+            if url.startswith(host):
+                return url[len(host):]
+        return None
+
+    def _ranked_hosts(self) -> List[str]:
+        """
+        Returns the hosts in the order they are tried: available hosts by latency, 
+        hosts without measurement first, followed by the hosts marked as down, the 
+        one recovering first at the front.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [host for host in self.hosts if self._states[host].down_until <= now]
+            down = [host for host in self.hosts if self._states[host].down_until > now]
+            available.sort(key=lambda host: (self._states[host].latency is not None, self._states[host].latency or 0.0))
+            down.sort(key=lambda host: self._states[host].down_until)
+        return available + down
+
+    def _record(self, host: str, latency: float) -> None:
+        with self._lock:
+            state = self._states[host]
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency = self.alpha * latency + (1 - self.alpha) * state.latency
+            state.failures = 0
+            state.down_until = 0.0
+
+    def _mark_down(self, host: str) -> None:
+        with self._lock:
+            state = self._states[host]
+            state.failures += 1
+            state.down_until = time.monotonic() + self.cooldown
+
+    def _check_periodically(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            self.check_health()
@@ -1,10 +1,44 @@
 #!/usr/bin/env python 
 
+import csv
+import io
+import json
+import mmap
+import operator
+import os
+import pickle
+import socketserver
+import tempfile
+import threading
+import time
 import unittest
-
-from pydracor import DraCorAPI, Corpus, Play, Wikidata, DTS, DownloadFormat, CorpusNotFound, PlayNotFound, InvalidParameterCombination
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pydracor import DraCorAPI, Corpus, Play, Wikidata, DTS, DownloadFormat, CorpusNotFound, PlayNotFound, InvalidParameterCombination, TEIArchive, HTTPXTransport, HostPool
+from pydracor.archive import zstandard
+from pydracor.network import network_metrics, np
+from pydracor.records import NetworkEdge, Relation, iter_csv_records, records_to_arrays
+from pydracor.transport import httpx
+from pydracor.api_wrapper import _CoalescingRESTClient
+from pydracor_base.api_client import ApiClient
+from pydracor_base.configuration import Configuration
+from pydracor_base.exceptions import ServiceException
+from pydracor_base.models import Corpus as CorpusModel
 from pydracor_base.models.corpus_in_corpora import CorpusInCorpora
 
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:
+    h2 = None
+
+
+def tei_length(play, tei):
+    return len(tei)
+
 
 # TODO: port is hardcoded, change?
 class TestDracorAPI(unittest.TestCase):
@@ -73,6 +107,20 @@ class TestDracorAPI(unittest.TestCase):
         result = self.dracor.get_resolve_play_id(play_id)
         self.assertIsNone(result)
 
+    def test_iter_plays(self):
+        plays = list(self.dracor.iter_plays(prefetch=2))
+        self.assertEqual(len(plays), 4)
+        self.assertTrue(all(isinstance(play, Play) for play in plays))
+
+        plays = list(self.dracor.iter_plays(
+            corpus_names=["test"], play_filter=lambda play: play.year_normalized > 1800
+        ))
+        self.assertTrue(all(play.year_normalized > 1800 for play in plays))
+        self.assertTrue(any(play.name == "gogol-revizor" for play in plays))
+
+        with self.assertRaises(CorpusNotFound):
+            list(self.dracor.iter_plays(corpus_names=["testy"]))
+
     def test_get_plays_with_character_by_id(self):
         wrong_character_id = "Q43718"
         character_id = "Q10322723"
@@ -151,6 +199,23 @@ class TestCorpus(unittest.TestCase):
         self.assertTrue(result.startswith("name"))
         self.assertEqual(len(result), 2008)
 
+    def test_iter_metadata_csv(self):
+        result = list(self.corpus.iter_metadata_csv())
+        rows = list(csv.reader(io.StringIO(self.corpus.get_metadata_csv())))
+        self.assertEqual(len(result), len(rows) - 1)
+        self.assertEqual(result[0]._fields[0], "name")
+        metadata = {play.name: play for play in self.corpus.get_metadata()}
+        for record in result:
+            self.assertEqual(record.year_normalized, metadata[record.name].year_normalized)
+            self.assertIsInstance(record.title, str)
+            self.assertIsInstance(record.num_of_speakers, int)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_records_to_arrays(self):
+        arrays = records_to_arrays(self.corpus.iter_metadata_csv())
+        self.assertEqual(len(arrays["name"]), 4)
+        self.assertEqual(arrays["year_normalized"].dtype, np.int64)
+
     # calls same function as in DraCor, test again here?
     def test_get_play(self):
         play_name = "gogol-revizor"
@@ -160,6 +225,44 @@ class TestCorpus(unittest.TestCase):
         with self.assertRaises(PlayNotFound):
             self.corpus.get_play("testy")
 
+    def test_pickle(self):
+        corpus = pickle.loads(pickle.dumps(self.corpus))
+        self.assertEqual(corpus.name, self.corpus_name)
+        self.assertEqual(len(corpus.plays), 4)
+        play = pickle.loads(pickle.dumps(corpus.get_play("lessing-emilia-galotti")))
+        self.assertEqual(len(play.get_characters()), 13)
+
+    def test_iter_plays(self):
+        names = [play.name for play in self.corpus.iter_plays(prefetch=2, fetch=["tei", "metrics"])]
+        self.assertEqual(names, [play.name for play in self.corpus.plays])
+
+        play = next(self.corpus.iter_plays(fetch=["tei"], play_names=["lessing-emilia-galotti"]))
+        self.assertEqual(play._prefetched.keys(), {"tei"})
+        self.assertEqual(len(play.get_tei()), 242843)
+        self.assertEqual(play._prefetched, {})
+        self.assertEqual(len(play.get_tei()), 242843)
+
+        with self.assertRaises(ValueError):
+            self.corpus.iter_plays(fetch=["testy"])
+        with self.assertRaises(PlayNotFound):
+            self.corpus.iter_plays(play_names=["testy"])
+
+    def test_map(self):
+        result = dict(self.corpus.map(tei_length, processes=2, fetch=["tei"]))
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result["lessing-emilia-galotti"], 242843)
+
+        total = self.corpus.map(tei_length, processes=2, fetch=["tei"], reduce=operator.add)
+        self.assertEqual(total, sum(result.values()))
+
+        result = dict(self.corpus.map(tei_length, fetch=["tei"], play_names=["lessing-emilia-galotti"]))
+        self.assertEqual(result, {"lessing-emilia-galotti": 242843})
+
+        with self.assertRaises(ValueError):
+            self.corpus.map(tei_length, fetch=["testy"])
+        with self.assertRaises(PlayNotFound):
+            self.corpus.map(tei_length, play_names=["testy"])
+
     
 class TestPlay(unittest.TestCase):
 
@@ -201,6 +304,25 @@ class TestPlay(unittest.TestCase):
         self.assertTrue(result.startswith("id"))
 
     
+    def test_iter_characters_csv(self):
+        result = list(self.play.iter_characters_csv())
+        self.assertEqual(len(result), 13)
+        self.assertEqual(result[0]._fields[0], "id")
+        self.assertEqual({record.id for record in result}, {character.id for character in self.play.characters})
+
+    def test_iter_networkdata_csv(self):
+        result = list(self.play.iter_networkdata_csv())
+        self.assertEqual(len(result), 29)
+        self.assertIsInstance(result[0], NetworkEdge)
+        self.assertIsInstance(result[0].weight, int)
+        rows = list(csv.reader(io.StringIO(self.play.get_networkdata(DownloadFormat.csv))))
+        self.assertEqual([list(edge[:3]) for edge in result], [row[:3] for row in rows[1:]])
+
+    def test_iter_relations_csv(self):
+        result = list(self.play.iter_relations_csv())
+        rows = list(csv.reader(io.StringIO(self.play.get_relations(DownloadFormat.csv))))
+        self.assertEqual(result, [Relation(*row) for row in rows[1:]])
+
     def test_get_networkdata(self):
         for format in [DownloadFormat.csv, DownloadFormat.gexf, DownloadFormat.graphml]:
             result = self.play.get_networkdata(format)
@@ -346,6 +468,500 @@ class TestDTS(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertEqual(len(result), 9062)
 
+
+class TestRawMode(unittest.TestCase):
+
+    def setUp(self):
+        self.dracor = DraCorAPI(host="http://localhost:8088/api/v1")
+        self.raw_dracor = DraCorAPI(host="http://localhost:8088/api/v1", raw=True)
+        self.play = self.dracor.get_play("test", "lessing-emilia-galotti")
+        self.raw_play = self.raw_dracor.get_play("test", "lessing-emilia-galotti")
+
+    def test_get_info(self):
+        info = self.raw_dracor.get_info()
+        self.assertIsInstance(info, dict)
+        self.assertEqual(info["name"], "DraCor API v1")
+
+    def test_get_corpora(self):
+        corpora = self.raw_dracor.get_corpora()
+        self.assertIsInstance(corpora[0], dict)
+        self.assertEqual([corpus["name"] for corpus in corpora], [corpus.name for corpus in self.dracor.get_corpora()])
+
+    def test_get_play(self):
+        self.assertIsInstance(self.raw_play, Play)
+        self.assertEqual(self.raw_play.name, self.play.name)
+        self.assertEqual(self.raw_play.year_normalized, self.play.year_normalized)
+        self.assertEqual(len(self.raw_play.segments), 43)
+        self.assertIsInstance(self.raw_play.characters[0], dict)
+        self.assertEqual(
+            [character["id"] for character in self.raw_play.characters],
+            [character.id for character in self.play.characters],
+        )
+        self.assertEqual(self.raw_play.to_dict()["name"], self.play.name)
+        with self.assertRaises(PlayNotFound):
+            self.raw_dracor.get_play("test", "lessing-emilia-galotty")
+
+    def test_get_metrics(self):
+        metrics = self.raw_play.get_metrics()
+        self.assertIsInstance(metrics, dict)
+        expected = self.play.get_metrics()
+        self.assertEqual(metrics["numEdges"], expected.num_edges)
+        self.assertEqual(len(metrics["nodes"]), len(expected.nodes))
+
+    def test_get_characters(self):
+        characters = self.raw_play.get_characters()
+        self.assertEqual(len(characters), 13)
+        self.assertIsInstance(characters[0], dict)
+
+    def test_corpus(self):
+        corpus = self.raw_dracor.get_corpus("test")
+        metadata = corpus.get_metadata()
+        self.assertIsInstance(metadata[0], dict)
+        self.assertEqual(len(metadata), len(corpus.plays))
+        plays = list(corpus.iter_plays(fetch=["metrics"]))
+        self.assertTrue(all(isinstance(play.get_metrics(), dict) for play in plays))
+
+    def test_pickle(self):
+        play = pickle.loads(pickle.dumps(self.raw_play))
+        self.assertEqual(play.to_dict(), self.raw_play.to_dict())
+        self.assertIsInstance(play.get_metrics(), dict)
+
+    @unittest.skipIf(np is None, "numpy and scipy are not installed")
+    def test_get_local_network_metrics(self):
+        metrics = self.raw_play.get_local_network_metrics()
+        self.assertEqual(metrics.num_edges, self.play.get_local_network_metrics().num_edges)
+
+    def test_iter_plays(self):
+        plays = list(self.raw_dracor.iter_plays(fetch=["metrics"]))
+        self.assertEqual(len(plays), len(list(self.dracor.iter_plays())))
+        self.assertTrue(all(isinstance(play.get_metrics(), dict) for play in plays))
+
+
+@unittest.skipIf(np is None, "numpy and scipy are not installed")
+class TestNetwork(unittest.TestCase):
+
+    def setUp(self):
+        self.dracor = DraCorAPI(host="http://localhost:8088/api/v1")
+        self.play = self.dracor.get_play("test", "lessing-emilia-galotti")
+
+    def test_get_incidence_matrix(self):
+        matrix, character_ids = self.play.get_incidence_matrix()
+        self.assertEqual(matrix.shape, (43, 13))
+        self.assertEqual(character_ids, [character.id for character in self.play.characters])
+        matrix, _ = self.play.get_incidence_matrix(segments=[1, 2])
+        self.assertEqual(matrix.shape, (2, 13))
+
+    def test_get_local_network_metrics(self):
+        result = self.play.get_local_network_metrics()
+        metrics = self.play.get_metrics()
+        self.assertEqual(result.size, metrics.size)
+        self.assertEqual(result.num_edges, metrics.num_edges)
+        self.assertAlmostEqual(result.density, metrics.density)
+        self.assertAlmostEqual(result.average_degree, metrics.average_degree)
+        self.assertAlmostEqual(result.average_clustering, metrics.average_clustering)
+        self.assertEqual(result.max_degree, metrics.max_degree)
+        self.assertEqual(result.max_degree_ids, metrics.max_degree_ids)
+        self.assertEqual(result.num_connected_components, metrics.num_connected_components)
+        nodes = {node.id: node for node in metrics.nodes}
+        for i, character_id in enumerate(result.character_ids):
+            self.assertEqual(result.degree[i], nodes[character_id].degree)
+            self.assertEqual(result.weighted_degree[i], nodes[character_id].weighted_degree)
+
+    def test_corpus(self):
+        corpus = self.dracor.get_corpus("test")
+        matrices = corpus.get_incidence_matrices()
+        self.assertEqual(len(matrices), 4)
+        matrix, character_ids = matrices["lessing-emilia-galotti"]
+        window = network_metrics(matrix[:10], character_ids)
+        self.assertLessEqual(window.num_edges, 29)
+
+        result = corpus.get_local_network_metrics(play_names=["lessing-emilia-galotti"])
+        self.assertEqual(result["lessing-emilia-galotti"].num_edges, 29)
+        with self.assertRaises(PlayNotFound):
+            corpus.get_local_network_metrics(play_names=["testy"])
+
+
+@unittest.skipIf(zstandard is None, "zstandard is not installed")
+class TestTEIArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.dracor = DraCorAPI(host="http://localhost:8088/api/v1")
+        self.corpus = self.dracor.get_corpus("test")
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.dracor")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_create(self):
+        with TEIArchive.create(self.corpus, self.path, formats=["tei", "txt"]) as archive:
+            self.assertEqual(len(archive), 4)
+            self.assertEqual(archive.corpus, "test")
+            self.assertTrue("lessing-emilia-galotti" in archive)
+            tei = archive.get_tei("lessing-emilia-galotti")
+            self.assertEqual(len(tei), 242843)
+            self.assertTrue(tei.startswith("<?xml-model"))
+            self.assertEqual(len(archive.get_txt("lessing-emilia-galotti")), 132335)
+            with self.assertRaises(PlayNotFound):
+                archive.get_tei("testy")
+        self.assertLess(os.path.getsize(self.path), 242843)
+
+        with TEIArchive(self.path) as archive:
+            self.assertEqual(archive.formats, ["tei", "txt"])
+            self.assertEqual(archive.get_tei("gogol-revizor"), self.corpus.get_play("gogol-revizor").get_tei())
+
+    def test_create_invalid(self):
+        with self.assertRaises(ValueError):
+            TEIArchive.create(self.corpus, self.path, formats=["csv"])
+        with self.assertRaises(PlayNotFound):
+            TEIArchive.create(self.corpus, self.path, play_names=["testy"])
+        with TEIArchive.create(self.corpus, self.path, play_names=["lessing-emilia-galotti"]) as archive:
+            self.assertEqual(archive.play_names(), ["lessing-emilia-galotti"])
+            with self.assertRaises(ValueError):
+                archive.get_txt("lessing-emilia-galotti")
+
+
+@unittest.skipIf(zstandard is None, "zstandard is not installed")
+class TestTEIArchiveFile(unittest.TestCase):
+
+    def test_open_invalid(self):
+        opened = []
+
+        def open_mmap(*args, **kwargs):
+            opened.append(real_mmap(*args, **kwargs))
+            return opened[-1]
+
+        real_mmap = mmap.mmap
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "invalid.dracor")
+            for content in (b"DRACOR", b"NOTANARCHIVE" * 4):
+                with open(path, "wb") as f:
+                    f.write(content)
+                with mock.patch("pydracor.archive.mmap.mmap", side_effect=open_mmap):
+                    with self.assertRaises(ValueError):
+                        TEIArchive(path)
+        self.assertEqual(len(opened), 2)
+        self.assertTrue(all(m.closed for m in opened))
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHTTPXTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = HTTPXTransport()
+        self.dracor = DraCorAPI(host="http://localhost:8088/api/v1", transport=self.transport)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_dracor(self):
+        self.assertEqual(self.dracor.get_info().name, "DraCor API v1")
+        play = self.dracor.get_play("test", "lessing-emilia-galotti")
+        self.assertEqual(len(play.get_tei()), 242843)
+        self.assertEqual(len(play.get_characters_csv()), 1619)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: play.get_metrics(), range(8)))
+        self.assertTrue(all(len(result.nodes) == 13 for result in results))
+        with self.assertRaises(PlayNotFound):
+            self.dracor.get_play("test", "testy")
+
+    def test_dts(self):
+        dts = DTS(host="http://localhost:8088/api/v1", transport=self.transport)
+        self.assertEqual(dts.get_dts().id, 'http://localhost:8088/api/v1/dts')
+        with self.assertRaises(InvalidParameterCombination):
+            dts.get_navigation("test000001", "body/div[1]", "body/div[2]/div[1]", None)
+
+
+class FakeCSVResponse(io.BytesIO):
+    status = 200
+    reason = "OK"
+    headers = {}
+
+    def release_conn(self):
+        pass
+
+
+class TestCSVRecords(unittest.TestCase):
+
+    def test_column_types(self):
+        response = FakeCSVResponse(b"name,size,density,libretto,title\na,3,0.5,false,1913\nb,,1,true,Emilia\n")
+        records = list(iter_csv_records(response, column_types={"size": int, "density": float, "libretto": bool}))
+        self.assertEqual(records[0]._fields, ("name", "size", "density", "libretto", "title"))
+        self.assertEqual([record.title for record in records], ["1913", "Emilia"])
+        self.assertEqual([record.size for record in records], [3, None])
+        self.assertEqual([record.density for record in records], [0.5, 1.0])
+        self.assertEqual([record.libretto for record in records], [False, True])
+
+    def test_header_mismatch(self):
+        response = FakeCSVResponse(b"Source,Target,Type,Weight\na,b,Undirected,2\n")
+        with self.assertRaises(ValueError):
+            list(iter_csv_records(response, NetworkEdge))
+        self.assertTrue(response.closed)
+        response = FakeCSVResponse(b"source,type,target,weight\na,Undirected,b,2\n")
+        self.assertEqual(list(iter_csv_records(response, NetworkEdge)), [NetworkEdge("a", "Undirected", "b", 2)])
+
+
+class FakeResponse:
+    def __init__(self, url):
+        self.data = url
+
+    def read(self):
+        return self.data
+
+
+class FakeRESTClient:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        self.calls += 1
+        self.release.wait()
+        if url.endswith("error"):
+            raise ValueError(url)
+        return FakeResponse(url)
+
+
+class TestCoalescing(unittest.TestCase):
+
+    def run_concurrently(self, url, n=8):
+        rest_client = FakeRESTClient()
+        coalescing = _CoalescingRESTClient(rest_client)
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            futures = [pool.submit(coalescing.request, "GET", url) for _ in range(n)]
+            # wait until all requests joined the call in flight
+            deadline = time.monotonic() + 10
+            while sum(call.waiters for call in list(coalescing._flight._calls.values())) < n - 1:
+                if time.monotonic() > deadline:
+                    rest_client.release.set()
+                    self.fail("The requests did not join the call in flight")
+                time.sleep(0.001)
+            rest_client.release.set()
+        return rest_client, futures
+
+    def test_identical_requests(self):
+        rest_client, futures = self.run_concurrently("http://localhost/play")
+        self.assertEqual(rest_client.calls, 1)
+        self.assertTrue(all(future.result().data == "http://localhost/play" for future in futures))
+
+    def test_exception_propagation(self):
+        rest_client, futures = self.run_concurrently("http://localhost/error")
+        self.assertEqual(rest_client.calls, 1)
+        errors = []
+        for future in futures:
+            with self.assertRaises(ValueError) as context:
+                future.result()
+            errors.append(context.exception)
+        # each caller raises its own exception, whose traceback is not extended by the others
+        self.assertEqual(len({id(error) for error in errors}), len(errors))
+        originals = [error.__cause__ or error for error in errors]
+        self.assertEqual(len({id(error) for error in originals}), 1)
+
+    def test_coalesce_per_wrapper(self):
+        Wikidata()
+        dracor = DraCorAPI(coalesce=False)
+        self.assertNotIsInstance(dracor._api.api_client.rest_client, _CoalescingRESTClient)
+        self.assertNotIsInstance(ApiClient.get_default().rest_client, _CoalescingRESTClient)
+        api_client = ApiClient()
+        DraCorAPI(api_client=api_client, transport=FakeRESTClient())
+        self.assertNotIsInstance(api_client.rest_client, (_CoalescingRESTClient, FakeRESTClient))
+        dracor = DraCorAPI(api_client=DraCorAPI()._api.api_client, coalesce=False)
+        self.assertNotIsInstance(dracor._api.api_client.rest_client, _CoalescingRESTClient)
+
+    def test_concurrent_play_requests(self):
+        dracor = DraCorAPI(host="http://localhost:8088/api/v1")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            metrics = list(pool.map(lambda _: dracor.get_play("test", "lessing-emilia-galotti").get_metrics(), range(8)))
+        self.assertTrue(all(len(m.nodes) == 13 for m in metrics))
+
+
+def stand_in_info(host):
+    return json.dumps({
+        "name": "DraCor API v1", "status": "stable", "existdb": "6.4.0", "version": "1.0.0",
+        "base": host, "openapi": host + "/openapi.yaml",
+    }).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Answers /info like a DraCor instance, after the delay of the server or with its error status.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.hits += 1
+        if self.server.stalled:
+            # accepts the connection but does not answer
+            self.server.release.wait()
+            return
+        time.sleep(self.server.delay)
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = stand_in_info(self.server.host)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_stand_in(delay=0.0, status=200, stalled=False):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.hits = 0
+    server.delay = delay
+    server.status = status
+    server.stalled = stalled
+    server.release = threading.Event()
+    server.host = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
+
+
+class TestHostPool(unittest.TestCase):
+
+    def setUp(self):
+        self.fast = start_stand_in()
+        self.slow = start_stand_in(delay=0.05)
+        self.failing = start_stand_in(status=503)
+        self.stalled = start_stand_in(stalled=True)
+        self.down = "http://127.0.0.1:1/api/v1"
+
+    def tearDown(self):
+        for server in (self.fast, self.slow, self.failing, self.stalled):
+            server.release.set()
+            server.shutdown()
+            server.server_close()
+
+    def test_latency_routing(self):
+        dracor = DraCorAPI(host=[self.slow.host, self.fast.host], coalesce=False)
+        for _ in range(20):
+            self.assertEqual(dracor.get_info().name, "DraCor API v1")
+        # each host is measured once, then all requests go to the fast host
+        self.assertEqual(self.slow.hits, 1)
+        self.assertEqual(self.fast.hits, 19)
+        status = dracor._api.api_client.rest_client.status()
+        self.assertLess(status[self.fast.host]["latency"], status[self.slow.host]["latency"])
+
+    def test_failover(self):
+        dracor = DraCorAPI(host=[self.down, self.failing.host, self.fast.host], coalesce=False)
+        for _ in range(5):
+            self.assertEqual(dracor.get_info().name, "DraCor API v1")
+        self.assertEqual(self.failing.hits, 1)
+        self.assertEqual(self.fast.hits, 5)
+        status = dracor._api.api_client.rest_client.status()
+        self.assertFalse(status[self.down]["available"])
+        self.assertFalse(status[self.failing.host]["available"])
+        self.assertTrue(status[self.fast.host]["available"])
+
+    def test_host_overrides_api_client(self):
+        api_client = ApiClient(configuration=Configuration(host=self.down))
+        dracor = DraCorAPI(api_client=api_client, host=[self.failing.host, self.fast.host], coalesce=False)
+        self.assertEqual(dracor.get_info().name, "DraCor API v1")
+        self.assertEqual(self.fast.hits, 1)
+        dracor = DraCorAPI(api_client=api_client, transport=HostPool([self.fast.host]), coalesce=False)
+        self.assertEqual(dracor.get_info().name, "DraCor API v1")
+        self.assertEqual(self.fast.hits, 2)
+        self.assertEqual(api_client.configuration.host, self.down)
+
+    def test_stalled_host(self):
+        pool = HostPool([self.stalled.host, self.fast.host], read_timeout=0.5)
+        dracor = DraCorAPI(transport=pool, coalesce=False)
+        start = time.perf_counter()
+        self.assertEqual(dracor.get_info().name, "DraCor API v1")
+        # the stalled host is given up after one read timeout, without retries
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(self.stalled.hits, 1)
+        self.assertFalse(pool.status()[self.stalled.host]["available"])
+
+    def test_all_hosts_failing(self):
+        dracor = DraCorAPI(host=[self.down, self.failing.host], coalesce=False)
+        with self.assertRaises(ServiceException):
+            dracor.get_info()
+
+    def test_health_check(self):
+        pool = HostPool([self.down, self.fast.host], cooldown=60)
+        self.assertEqual(pool.check_health(), {self.down: False, self.fast.host: True})
+        self.fast.status = 503
+        self.assertFalse(pool.check_health()[self.fast.host])
+        self.fast.status = 200
+        # a successful health check makes a host available before the cooldown ends
+        self.assertTrue(pool.check_health()[self.fast.host])
+        self.assertTrue(pool.status()[self.fast.host]["available"])
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_httpx_transport(self):
+        with HTTPXTransport() as transport:
+            dracor = DraCorAPI(host=[self.down, self.fast.host], transport=transport)
+            self.assertEqual(dracor.get_info().name, "DraCor API v1")
+
+    def test_pickle(self):
+        dracor = DraCorAPI(host=[self.down, self.fast.host])
+        corpus = Corpus(dracor._api, CorpusModel(name="test", title="Test", acronym="Test", uri="u", plays=[]))
+        restored = pickle.loads(pickle.dumps(corpus))
+        self.assertEqual(restored._api.api_client.configuration.host, self.down)
+        self.assertIsInstance(restored._api.api_client.rest_client._rest_client, HostPool)
+
+
+class H2StandInHandler(socketserver.BaseRequestHandler):
+    """
+    Answers every request with /info over HTTP/2 without TLS (prior knowledge),
+    counting connections and streams.
+    """
+
+    def handle(self):
+        self.server.connections += 1
+        connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        self.request.sendall(connection.data_to_send())
+        while True:
+            data = self.request.recv(65535)
+            if not data:
+                return
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    self.server.streams += 1
+                    body = stand_in_info(self.server.host)
+                    connection.send_headers(event.stream_id, [
+                        (":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body))),
+                    ])
+                    connection.send_data(event.stream_id, body, end_stream=True)
+            self.request.sendall(connection.data_to_send())
+
+
+@unittest.skipIf(httpx is None or h2 is None, "httpx[http2] is not installed")
+class TestHTTP2(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), H2StandInHandler)
+        self.server.daemon_threads = True
+        self.server.connections = 0
+        self.server.streams = 0
+        self.server.host = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.transport = HTTPXTransport(http1=False)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_multiplexing(self):
+        dracor = DraCorAPI(host=self.server.host, transport=self.transport, coalesce=False)
+        self.assertEqual(dracor._api.api_info_without_preload_content().http_version, "HTTP/2")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: dracor.get_info(), range(32)))
+        self.assertTrue(all(result.name == "DraCor API v1" for result in results))
+        # all concurrent requests share one connection
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.server.streams, 33)
+
+
 if __name__ == "__main__":
     unittest.main()
 